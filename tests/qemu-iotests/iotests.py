@@ -132,24 +132,23 @@ class VM(object):
         self._qmp.clear_events()
         return events
 
-index_re = re.compile(r'([^\[]+)\[([^\]]+)\]')
-
 class QMPTestCase(unittest.TestCase):
     '''Abstract base class for QMP test cases'''
 
     def dictpath(self, d, path):
         '''Traverse a path in a nested dict'''
         for component in path.split('/'):
-            m = index_re.match(component)
-            if m:
-                component, idx = m.groups()
-                idx = int(idx)
+            lb = component.find('[')
+            if lb > 0:
+                component, idx = component[:lb], int(component[lb+1:].rstrip(']'))
+            else:
+                idx = None
 
             if not isinstance(d, dict) or component not in d:
                 self.fail('failed path traversal for "%s" in "%s"' % (path, str(d)))
             d = d[component]
 
-            if m:
+            if idx is not None:
                 if not isinstance(d, list):
                     self.fail('path component "%s" in "%s" is not a list in "%s"' % (component, path, str(d)))
                 try: